@@ -39,7 +39,7 @@ except ImportError:
 
 __version__ = "0.6.1"
 
-from .paths import resources_path, calibrants_path, icons_path, data_path, style_path
+from .paths import resources_path, calibrants_path, icons_path, data_path, style_path, get_stylesheet
 from .excepthook import excepthook
 from .controller.MainController import MainController
 
@@ -18,10 +18,18 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import os
 
 resources_path = os.path.join(os.path.dirname(__file__), 'resources')
 calibrants_path = os.path.join(resources_path, 'calibrants')
 icons_path = os.path.join(resources_path, 'icons')
 data_path = os.path.join(resources_path, 'data')
-style_path = os.path.join(resources_path, 'style')
\ No newline at end of file
+style_path = os.path.join(resources_path, 'style')
+
+
+@functools.lru_cache(maxsize=None)
+def get_stylesheet(filename='stylesheet.qss'):
+    """Returns the content of a stylesheet from the style resources, read only once"""
+    with open(os.path.join(style_path, filename)) as file:
+        return file.read()
@@ -22,22 +22,11 @@ import weakref
 import pytest
 from qtpy import QtCore, QtWidgets
 from qtpy.QtTest import QTest
-from dioptas.controller import CalibrationController
 
-from dioptas.controller.MainController import MainController
-
-from dioptas.controller.integration import (
-    PhaseController,
-    PatternController,
-    BatchController,
-    BackgroundController,
-    IntegrationController,
-)
-from dioptas.controller.integration.ImageController import ImageController
-
-from dioptas.model.DioptasModel import DioptasModel
-from dioptas.widgets.integration import IntegrationWidget
-from dioptas.widgets.CalibrationWidget import CalibrationWidget
+# Heavyweight dioptas imports are done lazily inside the fixtures:
+# conftest.py is imported for the whole test tree at collection time,
+# so importing controllers/widgets here would slow down collecting
+# test files that do not use these fixtures.
 
 
 @pytest.fixture(scope="session")
@@ -60,28 +49,39 @@ def qWidgetFactory(qapp):
     This fixture provides a function taking a QWidget subclass as argument
     which returns an instance of this QWidget making sure it is shown first
     and destroyed once the test is done.
+
+    Tests that only exercise the widget API can pass show=False to skip
+    showing the widget and waiting for its window to be exposed.
     """
+    # Strong references: tests only receive weakref proxies
     widgets = set()
 
-    def createWidget(cls, *args, **kwargs):
+    def createWidget(cls, *args, show=True, **kwargs):
         widget = cls(*args, **kwargs)
         widget.setAttribute(QtCore.Qt.WA_DeleteOnClose)
-        widget.show()
-        QTest.qWaitForWindowExposed(widget)
+        if show:
+            widget.show()
+            QTest.qWaitForWindowExposed(widget)
         widgets.add(widget)
         return weakref.proxy(widget)
 
     try:
         yield createWidget
     finally:
-        for widget in widgets:
-            widget.close()
+        for widget in list(widgets):
+            widget.hide()
+            widget.setParent(None)
+            widget.deleteLater()
+        # Process the batched deferred deletions in a single event loop pass
+        qapp.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
         qapp.processEvents()
 
 
 @pytest.fixture
 def main_controller(qapp):
     """Fixture providing a MainController instance"""
+    from dioptas.controller.MainController import MainController
+
     controller = MainController(use_settings=False)
     controller.show_window()
     controller.widget.setAttribute(QtCore.Qt.WA_DeleteOnClose)
@@ -96,22 +96,35 @@ def main_controller(qapp):
 
 @pytest.fixture(scope="function")
 def dioptas_model():
-    model = DioptasModel()
-    yield model
+    # Function-scoped on purpose: tests monkeypatch model signals
+    # (created in DioptasModel.__init__ only), so a shared instance
+    # would leak mocked signals into later tests
+    from dioptas.model.DioptasModel import DioptasModel
+
+    return DioptasModel()
 
 
 @pytest.fixture
 def phase_controller(integration_widget, dioptas_model):
+    from dioptas.controller.integration import PhaseController
+
     return PhaseController(integration_widget, dioptas_model)
 
 
 @pytest.fixture
 def pattern_controller(integration_widget, dioptas_model):
+    from dioptas.controller.integration import PatternController
+
     return PatternController(integration_widget, dioptas_model)
 
 
 @pytest.fixture
 def integration_widget(qtbot):
+    # Function-scoped on purpose: controllers mutate plot-side state
+    # (e.g. pattern_widget overlays and legend) that a shared instance
+    # would leak into later tests
+    from dioptas.widgets.integration import IntegrationWidget
+
     widget = IntegrationWidget()
     yield widget
     widget.close()
@@ -119,6 +132,8 @@ def integration_widget(qtbot):
 
 @pytest.fixture
 def calibration_widget(qtbot):
+    from dioptas.widgets.CalibrationWidget import CalibrationWidget
+
     widget = CalibrationWidget()
     yield widget
     widget.close()
@@ -126,6 +141,8 @@ def calibration_widget(qtbot):
 
 @pytest.fixture
 def integration_controller(integration_widget, dioptas_model, qtbot):
+    from dioptas.controller.integration import IntegrationController
+
     return IntegrationController(widget=integration_widget, dioptas_model=dioptas_model)
 
 
@@ -136,6 +153,8 @@ def batch_model(dioptas_model):
 
 @pytest.fixture
 def batch_controller(integration_widget, dioptas_model):
+    from dioptas.controller.integration import BatchController
+
     return BatchController(integration_widget, dioptas_model)
 
 
@@ -146,16 +165,22 @@ def batch_widget(integration_widget):
 
 @pytest.fixture
 def background_controller(integration_widget, dioptas_model, qtbot):
+    from dioptas.controller.integration import BackgroundController
+
     return BackgroundController(integration_widget, dioptas_model)
 
 
 @pytest.fixture
 def image_controller(integration_widget, dioptas_model, qtbot):
+    from dioptas.controller.integration.ImageController import ImageController
+
     return ImageController(integration_widget, dioptas_model)
 
 
 @pytest.fixture
 def calibration_controller(calibration_widget, dioptas_model, qtbot):
+    from dioptas.controller import CalibrationController
+
     return CalibrationController(calibration_widget, dioptas_model)
 
 
@@ -21,7 +21,14 @@
 import numpy as np
 import pytest
 
-from dioptas.widgets.plot_widgets.utils import AutoLevel
+from dioptas.widgets.plot_widgets import utils
+from dioptas.widgets.plot_widgets.utils import (
+    AutoLevel,
+    auto_level_all_from_histogram,
+    auto_level_cache_clear,
+    auto_level_from_histogram,
+    weighted_average_std,
+)
 
 
 def test_default_mode():
@@ -52,7 +59,7 @@ def test_mean3std_mode():
     data.shape = 1, -1
     range_ = auto_level.get_range(data)
     mean, std = np.mean(data), np.std(data)
-    assert range_ == (mean - 3 * std, mean + 3 * std)
+    assert range_ == pytest.approx((mean - 3 * std, mean + 3 * std))
 
 
 def test_mean3std_mode_clipped_to_minmax():
@@ -111,3 +118,90 @@ def test_filter_dummy():
 
     range_ = auto_level.get_range(np.transpose(data))
     assert range_ == (0, 4)
+
+
+def test_weighted_average_std():
+    a = np.linspace(-10, 10, 101)
+    weights = np.arange(101, dtype=np.float64)
+    average, std = weighted_average_std(a, weights)
+    expected_average = np.average(a, weights=weights)
+    expected_std = np.sqrt(np.average((a - expected_average) ** 2, weights=weights))
+    assert average == pytest.approx(expected_average)
+    assert std == pytest.approx(expected_std)
+
+
+def test_weighted_average_std_constant_values():
+    # Variance must not become negative through cancellation
+    a = np.full(100, 42.0)
+    average, std = weighted_average_std(a, np.ones(100))
+    assert average == pytest.approx(42.0)
+    assert std == 0.0
+
+
+@pytest.mark.parametrize(
+    "mode,expected",
+    [
+        ("default", (1.0, 98.0)),
+        ("minmax", (0.0, 100.0)),
+        ("mean3std", (0.0, 100.0)),
+    ],
+)
+def test_auto_level_from_histogram(mode, expected):
+    counts, bin_edges = np.histogram(np.arange(101), bins=100)
+    range_ = auto_level_from_histogram(counts, bin_edges, mode)
+    assert range_ == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "counts,bin_edges",
+    [
+        (np.array([]), np.array([0.0])),
+        (np.array([0, 0, 0]), np.array([0.0, 1.0, 2.0, 3.0])),
+    ],
+)
+def test_auto_level_from_histogram_degenerate(counts, bin_edges):
+    assert auto_level_from_histogram(counts, bin_edges) is None
+
+
+def test_auto_level_from_histogram_unsupported_mode():
+    counts, bin_edges = np.histogram(np.arange(101), bins=100)
+    with pytest.raises(ValueError):
+        auto_level_from_histogram(counts, bin_edges, "unsupported")
+
+
+def test_auto_level_from_histogram_cache():
+    auto_level_cache_clear()
+    counts, bin_edges = np.histogram(np.arange(101), bins=100)
+    range_ = auto_level_from_histogram(counts, bin_edges)
+    assert auto_level_from_histogram(counts, bin_edges) == range_
+
+    # In-place modification of the same buffers must not hit a stale entry
+    counts[:] = 0
+    counts[50] = 101
+    assert auto_level_from_histogram(counts, bin_edges) != range_
+
+    auto_level_cache_clear()
+    assert len(utils._AUTOLEVEL_CACHE) == 0
+
+
+@pytest.mark.parametrize("mode", ["default", "mean3std"])
+def test_auto_level_from_histogram_numba_numpy_equivalence(monkeypatch, mode):
+    rng = np.random.default_rng(42)
+    counts, bin_edges = np.histogram(rng.normal(10, 5, 10000), bins=64)
+
+    func = utils._HISTOGRAM_MODES[mode]
+    range_ = func(counts, bin_edges)
+
+    monkeypatch.setattr(utils, "_fused_default_from_histogram", None)
+    monkeypatch.setattr(utils, "_fused_mean3std_from_histogram", None)
+    assert func(counts, bin_edges) == pytest.approx(range_)
+
+
+def test_auto_level_all_from_histogram():
+    counts, bin_edges = np.histogram(np.arange(101), bins=100)
+    ranges = auto_level_all_from_histogram(counts, bin_edges)
+    assert set(ranges) == {"default", "minmax", "mean3std"}
+    for mode, range_ in ranges.items():
+        assert range_ == auto_level_from_histogram(counts, bin_edges, mode)
+
+    assert auto_level_all_from_histogram(np.array([0]), np.array([0.0, 1.0])) is None
@@ -31,7 +31,7 @@ from ...widgets.plot_widgets.ColormapPopup import ColormapPopup
 
 def testRange(qWidgetFactory):
     """Test getRange, setRange and sigRangeChanged"""
-    colormapPopup = qWidgetFactory(ColormapPopup)
+    colormapPopup = qWidgetFactory(ColormapPopup, show=False)
     assert colormapPopup.getRange() == (1, 1)
 
     signalSpy = QSignalSpy(colormapPopup.sigRangeChanged)
@@ -49,7 +49,7 @@ def testRange(qWidgetFactory):
 
 def testCurrentGradient(qWidgetFactory):
     """Test getCurrentGradient, setCurrentGradient and sigCurrentGradientChanged"""
-    colormapPopup = qWidgetFactory(ColormapPopup)
+    colormapPopup = qWidgetFactory(ColormapPopup, show=False)
     for firstName, firstGradient in pyqtgraph.graphicsItems.GradientEditorItem.Gradients.items():
         break
     gradient = colormapPopup.getCurrentGradient()
@@ -68,7 +68,7 @@ def testCurrentGradient(qWidgetFactory):
 
 def testCustomGradient(qWidgetFactory):
     """Test setCurrentGradient with a custom gradient"""
-    colormapPopup = qWidgetFactory(ColormapPopup)
+    colormapPopup = qWidgetFactory(ColormapPopup, show=False)
     signalSpy = QSignalSpy(colormapPopup.sigCurrentGradientChanged)
 
     customGradient = {
@@ -97,7 +97,7 @@ def testCustomGradient(qWidgetFactory):
 @pytest.mark.parametrize("normalization", ["log", "sqrt"])
 def testCurrentNormalization(qWidgetFactory, normalization):
     """Test getCurrentNormalization, setCurrentNormalization and sigCurrentNormalizationChanged"""
-    colormapPopup = qWidgetFactory(ColormapPopup)
+    colormapPopup = qWidgetFactory(ColormapPopup, show=False)
 
     default_normalization = colormapPopup.getCurrentNormalization()
     assert default_normalization == "linear"
@@ -59,7 +59,7 @@ class ConfigurationWidgetTest(QtTest):
         self.config_widget.update_configuration_btns(self.model.configurations, 0)
 
         click_button(self.config_widget.configuration_btns[3])
-        self.config_widget.configuration_selected.emit.assert_called_once_with(3, True)
+        self.config_widget.configuration_selected.emit.assert_called_once_with(3)
 
         self.assertFalse(self.config_widget.configuration_btns[0].isChecked())
         self.assertFalse(self.config_widget.configuration_btns[1].isChecked())
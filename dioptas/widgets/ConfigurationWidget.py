@@ -18,7 +18,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from functools import partial
 
 from qtpy import QtWidgets, QtCore
 
@@ -147,12 +146,17 @@ class ConfigurationWidget(QtWidgets.QWidget):
             new_button = CheckableButton(str(ind + 1))
             new_button.setFixedSize(25, 25)
             new_button.setToolTip("Switch to configuration {}".format(ind + 1))
-            self.configuration_btn_group.addButton(new_button)
+            self.configuration_btn_group.addButton(new_button, ind)
             self.configuration_btns.append(new_button)
             self.configurations_btn_layout.addWidget(new_button)
             if ind == cur_ind:
                 new_button.setChecked(True)
-            new_button.clicked.connect(partial(self.configuration_selected.emit, ind))
+            new_button.clicked.connect(self._configuration_btn_clicked)
+
+    def _configuration_btn_clicked(self):
+        """Single slot for all configuration buttons, dispatched by button group id"""
+        ind = self.configuration_btn_group.id(self.sender())
+        self.configuration_selected.emit(ind)
 
     def add_tooltips(self):
         self.add_configuration_btn.setToolTip("Add configuration")
@@ -6,7 +6,7 @@ import numpy as np
 from .plot_widgets.HistogramLUTItem import HistogramLUTItem
 
 from .CustomWidgets import FlatButton
-from .. import style_path
+from .. import get_stylesheet
 
 
 class Map2DWidget(QtWidgets.QWidget):
@@ -502,10 +502,7 @@ class OpenBGImageDialog(QtWidgets.QDialog):
         self.setWindowFlags(QtCore.Qt.FramelessWindowHint)
         self.ok_btn.setToolTip('# of files must equal # of points')
 
-        file = open(os.path.join(style_path, "stylesheet.qss"))
-        stylesheet = file.read()
-        self.setStyleSheet(stylesheet)
-        file.close()
+        self.setStyleSheet(get_stylesheet())
 
     def _connect_widgets(self):
         """
@@ -21,7 +21,7 @@
 from qtpy import QtCore, QtWidgets, QtGui
 import os
 from .CustomWidgets import FlatButton
-from .. import style_path
+from .. import get_stylesheet
 
 
 class CifConversionParametersDialog(QtWidgets.QDialog):
@@ -95,10 +95,7 @@ class CifConversionParametersDialog(QtWidgets.QDialog):
 
         self.setWindowFlags(QtCore.Qt.FramelessWindowHint)
 
-        file = open(os.path.join(style_path, "stylesheet.qss"))
-        stylesheet = file.read()
-        self.setStyleSheet(stylesheet)
-        file.close()
+        self.setStyleSheet(get_stylesheet())
 
     def _connect_widgets(self):
         """
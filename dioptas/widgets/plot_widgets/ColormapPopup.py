@@ -19,17 +19,92 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import functools
 import pathlib
 from typing import Optional
 
 from qtpy import QtGui, QtCore, QtWidgets
-import pyqtgraph.graphicsItems.GradientEditorItem
 import numpy as np
 
+# pyqtgraph.graphicsItems.GradientEditorItem is imported lazily where needed:
+# it pulls in a large part of pyqtgraph's QGraphicsView machinery.
+
 from . import utils
 from .NormalizedImageItem import NormalizedImageItem
 from ... import style_path
 
+try:
+    from ._gradient_icons import ICONS as _GRADIENT_ICON_PNGS
+except ImportError:  # Pre-rendered icons not generated
+    _GRADIENT_ICON_PNGS = {}
+
+
+def _gradientKey(gradient: dict) -> tuple:
+    """Returns a hashable key identifying a gradient description"""
+    return (
+        gradient['mode'],
+        tuple((position, tuple(color)) for position, color in gradient['ticks']),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _gradientKeyToName() -> dict:
+    """Returns the lookup table mapping gradient key to built-in gradient name"""
+    from pyqtgraph.graphicsItems.GradientEditorItem import Gradients
+
+    return {_gradientKey(gradient): name for name, gradient in Gradients.items()}
+
+
+def _createQIconFromGradient(gradient: dict) -> QtGui.QIcon:
+    """Generates a QIcon from a pyqtgraph gradient"""
+    from pyqtgraph.graphicsItems.GradientEditorItem import GradientEditorItem
+
+    gradientEditorItem = GradientEditorItem()
+    gradientEditorItem.setLength(100)
+    gradientEditorItem.restoreState(gradient)
+    qgradient = gradientEditorItem.getGradient()
+
+    pixmap = QtGui.QPixmap(100, 100)
+    painter = QtGui.QPainter(pixmap)
+    brush = QtGui.QBrush(qgradient)
+    painter.fillRect(QtCore.QRect(0, 0, 100, 100), brush)
+    painter.end()
+    return QtGui.QIcon(pixmap)
+
+
+@functools.lru_cache(maxsize=None)
+def _getGradientQIcon(name: str) -> QtGui.QIcon:
+    """Returns the QIcon of a built-in pyqtgraph gradient, rendered only once
+
+    Uses pre-rendered PNG data generated by scripts/generate_gradient_icons.py
+    when available, which avoids QPainter rasterization entirely.
+    """
+    data = _GRADIENT_ICON_PNGS.get(name)
+    if data is not None:
+        pixmap = QtGui.QPixmap()
+        if pixmap.loadFromData(data, "PNG"):
+            return QtGui.QIcon(pixmap)
+
+    from pyqtgraph.graphicsItems.GradientEditorItem import Gradients
+
+    return _createQIconFromGradient(Gradients[name])
+
+
+def _prewarmGradientQIcons():
+    """Pre-load the built-in gradient icons so that the first popup opens fast
+
+    Only uses the pre-rendered PNG data: enumerating the gradients from
+    pyqtgraph would defeat the deferred import of GradientEditorItem.
+    """
+    if QtGui.QGuiApplication.instance() is None:
+        return  # Creating pixmaps requires a QGuiApplication
+
+    for name in _GRADIENT_ICON_PNGS:
+        _getGradientQIcon(name)
+
+
+_prewarmGradientQIcons()
+
 
 class ColormapPopup(QtWidgets.QFrame):
     """Dialog providing control over the currently used colormap"""
@@ -53,6 +128,7 @@ class ColormapPopup(QtWidgets.QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data = None
+        self._rangeCache = {}  # (mode, filter_dummy) -> autoscale range of current data
         self.setWindowTitle("Colormap configuration")
         self.setWindowFlags(QtCore.Qt.Popup)
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
@@ -70,9 +146,11 @@ class ColormapPopup(QtWidgets.QFrame):
         colormapLayout.setContentsMargins(0, 6, 0, 0)
         colormapLayout.setLabelAlignment(QtCore.Qt.AlignRight)
 
+        from pyqtgraph.graphicsItems.GradientEditorItem import Gradients
+
         self._gradientComboBox = QtWidgets.QComboBox(self)
-        for name, gradient in pyqtgraph.graphicsItems.GradientEditorItem.Gradients.items():
-            icon = self._createQIconFromGradient(gradient)
+        for name, gradient in Gradients.items():
+            icon = _getGradientQIcon(name)
             self._gradientComboBox.addItem(icon, name.capitalize(), gradient)
         self._gradientComboBox.currentIndexChanged.connect(self._gradientComboBoxCurrentIndexChanged)
         colormapLayout.addRow('Colormap:', self._gradientComboBox)
@@ -148,6 +226,7 @@ class ColormapPopup(QtWidgets.QFrame):
     def setData(self, data: Optional[np.ndarray], copy: bool = True):
         """Set data and histogram to use for autoscale"""
         self._data = None if data is None else np.array(data, copy=copy)
+        self._rangeCache.clear()
         self._autoscaleButton.setEnabled(data is not None)
 
     def getData(self, copy: bool = True) -> Optional[np.ndarray]:
@@ -173,12 +252,18 @@ class ColormapPopup(QtWidgets.QFrame):
 
         If the gradient is not available, a 'Custom' item is added for it.
         """
-        for name, description in pyqtgraph.graphicsItems.GradientEditorItem.Gradients.items():
-            if gradient['mode'] == description['mode'] and gradient['ticks'] == description['ticks']:
-                self._gradientComboBox.setCurrentText(name.capitalize())
-                return
+        current = self._gradientComboBox.currentData()
+        if current is gradient or (
+            current is not None and _gradientKey(current) == _gradientKey(gradient)
+        ):
+            return  # Already selected: avoid combo box index churn
+
+        name = _gradientKeyToName().get(_gradientKey(gradient))
+        if name is not None:
+            self._gradientComboBox.setCurrentText(name.capitalize())
+            return
 
-        icon = self._createQIconFromGradient(gradient)
+        icon = _createQIconFromGradient(gradient)
         # Block signals to avoid emitting with previously selected gradient since index changes
         wasBlocked = self._gradientComboBox.blockSignals(True)
         self._gradientComboBox.insertItem(0, icon, 'Custom', gradient)
@@ -194,7 +279,13 @@ class ColormapPopup(QtWidgets.QFrame):
         index = self._normalizationComboBox.findData(normalization)
         if index < 0:
             raise ValueError(f"Unsupported normalization: {normalization}")
+        if index == self._normalizationComboBox.currentIndex():
+            return
+        # Block signals to emit exactly once even if called from a signal handler
+        wasBlocked = self._normalizationComboBox.blockSignals(True)
         self._normalizationComboBox.setCurrentIndex(index)
+        self._normalizationComboBox.blockSignals(wasBlocked)
+        self.sigCurrentNormalizationChanged.emit(normalization)
 
     def getCurrentNormalization(self) -> str:
         """Returns the currently selected normalization"""
@@ -236,22 +327,11 @@ class ColormapPopup(QtWidgets.QFrame):
     def _autoscaleRequested(self, *args):
         utils.auto_level.mode = self._getResetMode()
         utils.auto_level.filter_dummy = self._filterGapsCheckBox.isChecked()
-        colormapRange = utils.auto_level.get_range(self.getData(copy=False))
+        key = utils.auto_level.mode, utils.auto_level.filter_dummy
+        if key not in self._rangeCache:
+            # Memoized so that cycling through reset modes does not re-scan the data
+            self._rangeCache[key] = utils.auto_level.get_range(self.getData(copy=False))
+        colormapRange = self._rangeCache[key]
         if colormapRange is None:
              return
         self.setRange(*colormapRange)
-
-    @staticmethod
-    def _createQIconFromGradient(gradient: dict) -> QtGui.QIcon:
-        """Generates a QIcon from a pyqtgraph gradient"""
-        gradientEditorItem = pyqtgraph.graphicsItems.GradientEditorItem.GradientEditorItem()
-        gradientEditorItem.setLength(100)
-        gradientEditorItem.restoreState(gradient)
-        qgradient = gradientEditorItem.getGradient()
-
-        pixmap = QtGui.QPixmap(100, 100)
-        painter = QtGui.QPainter(pixmap)
-        brush = QtGui.QBrush(qgradient)
-        painter.fillRect(QtCore.QRect(0, 0, 100, 100), brush)
-        painter.end()
-        return QtGui.QIcon(pixmap)
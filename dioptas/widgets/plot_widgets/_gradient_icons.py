@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Pre-rendered PNG icons of the built-in pyqtgraph gradients
+
+Generated by scripts/generate_gradient_icons.py: do not edit manually.
+"""
+from __future__ import annotations
+
+ICONS: dict[str, bytes] = {
+    'thermal': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x014IDATx\x9c\xed\xd0;\x8e\x83@\x10@\xc1f\x90\xc1\xf7?\xf1\x06\x96\xd7H8\xf0\xcb\xab\x82\xd60\x1f\x82\xb7\xed3\xc7\xcc\xe3=_\x8b\xe3\xdb\xe6c\xe6\xfc\xb6y=\xba\xfe\xe1sa\xcdv\xcc~\xce:f\x1d\xb3\xce\xcb|\xce:f?\xdf\x17\xce\xdb\x85\xf7\xdco\xaf\xfe?_\xcf\xb7\xfd\x98\xed9\xdbs\xb6\xf32\xaf\x8b\xcb\xd1z\xad\xefG\xf7\xe7\x9f\xf5\x1a~&V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V V\xf0\x07\xa0@\x03\xc0t\x97\xc5\x93\x00\x00\x00\x00IEND\xaeB`\x82',
+    'flame': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01oIDATx\x9c\xed\xd0\xcbN\xc40\x10\x05\xd1\xdb(\x10\xe75\xff\xff\xafv"\x163A\x80\x84D\xed\xeb,\xac\x8e\xdd\xca\xa2*\xf9\xa8\xac\xc9\x9e\xec\x955\xd9\x92\xb5\xb2\'[\xb2\xddO[e\xbbo\xb6d}.O\x99Z\xae9g\xcb\xd9r\xce\xf79\xe7j9\x97\xd7\xfc5\\\xdfw\x96\xd7\xcdh9\xe7\xdf?\xb9\xa6iT\xebi#KO\xbb\xe7\xd6\xab\x8d\xb4Q\xcb\xf3sd\xe9\xf7\xd3\xa8\xd6\x7f.?oFZ\xafyd\xedi\xa3\xe6\x91\xf7\xb7\xaa#yT\xed\xc9\x91\xecU\x8fd\xaf:\xee\xf3\xf8\xe3\xe9\xf1\x16\xfd\x9b\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\x9f<\x0c>\xbe\x1f\xc8\r\xb1\x00\x00\x00\x00IEND\xaeB`\x82',
+    'yellowy': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01YIDATx\x9c\xed\xd0\xb1j\xc40\x10\x00\xd1]ie\xebH\x91\xcb\xff\x7f\xa8\x95.\x85\xf1\xe1@\x0e2\xfd<\x84X-\xaa&3z\xc6\x961\xda\xed\xce\xd8Z\x8c\xdb\xfe|\x9e\xfb\xf3\xc3\xaf}\x8b\xadg\xb5\x18=\xabG\xf5\xac\x1e\xa3\xdd\xe67\x9bj9\xaeM\xf5\x1c=\xaa\xdd\xfe\xf7\xac\xda\xbfk_c\x1e5\xd7\xd8\xd7y\x8f\xc7Q\x7f\xcf\xeb\xcd\xfe\x9a\xe71\xe6\xaa}\x8d\xb9j\x1e\x99\x1f\x11\xcf\x88\xaf\x88\xcf\xeb\xdc\xe7\xd7\xf3y\xce-\xf4o\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\xfc\x00\xeb\xa7"\xbd\x8c\xab)\xd4\x00\x00\x00\x00IEND\xaeB`\x82',
+    'bipolar': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01"IDATx\x9c\xed\xd01n\xc2@\x10@\xd1!\x92\x0b\x92\xfb\x1f\x15#\x92H\xa1\x02\x81\xb0Q~\xff\x9e\xa6\x18{W[\xfc\xc3\\\xfef\x9d9\xcd\xac\x0fsz\xde\xcf[\xff_\xaf\xfd~\xef\x9f\xad;\xb3}m\x99\x9f\xaf\x99\xcf\xdb<\xee\xf7\xcf\xe3\xcb\xd1\xe6\xb5e\xd9?\xbb\xef\xc7\xb7O\xdc\xf6\x8f\xe1\xdf\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xaeZ\xc45\xc1zp\xf2\xe4\x00\x00\x00\x00IEND\xaeB`\x82',
+    'spectrum': b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x014IDATx\x9c\xed\xd0\xb1n\xc2@\x14\x00\xc1\x97H\x81\x06\xf3\xff\xdf\t4\xd0\x84\xca\x91\xe3\xc8R\xb6\x9f\x91e\xdd]\xe1w\xde\x8f\xef\xf3\xcce\xe6:s\x99Y\xd6\xf7n{p\xfe<\xcdc\xe6>\xf3\x98\xb9\xad\x8b\x9f\xedc\xdd\xde6\xe7\xf7\xf5y\xcdi\x1d\xbc\x1d\xb3l\x06\\\x0f\xd6\xcb\xbc\xce\xfb\xcfm'\xed.\xf1\xfb~_\xcf\xfd\xa4\xa3\x7f\xfd{\xb9\xcf\xe1\xdf\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xc4\n\xdeu\x1c,\xbf\x8b\x08\x15z\x00\x00\x00\x00IEND\xaeB`\x82",
+    'cyclic': b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01\x80IDATx\x9c\xed\xd0\xc1N\xdb@\x00\x06\xe1i\x89\xa3\xe2D\x18\xde\xff!\xc1\x01\\5\xa6\r\x07+j\xd4^\x98\xfb|\xda\xc3\xaf=x\xe5\xf9v\xe1\x08\x13<\xc1\x03L\xd7\xf3\xb4\x8d\xdf\x1c\xcf\x1cV\xeeW\xc63\xf7\xdb>3n7o\x0c3\xccp\x82g\x98o\xce\x0b,\x03\x1f\x07\xd6\x91\xf5\xc8\xc7\xc8z`\x1d\xaf\xe3\xc0\x9f#L\x17\x1ea\x82\x87\x0b\x13L\x97\xbf\xfb\xc7\xaf\xeb'O0\xc3\xf3u\xcc0\xdfq\x1aX\xf6\xfc\x1cX\xf6,\xff\xec\x91u\xfb\x87\xc7\xff\xff\x07\xc6\x95aaxg\xf7\xce\xb0\xb0[\xd8\xbf\xb1\xdbn\x16\xee^o\xde<\xdd<{\x82\x17\xbe\x93/+\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xa1XB\xb1\x84b\t\xc5\x12\x8a%\x14K(\x96P,\xe1\x13>\x05M\xcfA\x18%\x1a\x00\x00\x00\x00IEND\xaeB`\x82",
+    'greyclip': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01\x06IDATx\x9c\xed\xd0;\n\xc30\x14\x00\xc1H\xef\xf8\xbet\x8a\x80\x8b`\x88\x16R\xce\x14\x02}A\xbb\xd6Z333{\xef{\xfc\x9a\x9e,>\xee>n\xfd<\xf3\xf1\x97\xc7O.\x1e~v_\xd7~qL\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac@\xac\xe0\r\xb3\x0b\x04\xd7S\x92H{\x00\x00\x00\x00IEND\xaeB`\x82',
+    'grey': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x00\xf7IDATx\x9c\xed\xd0\xb1\t\xc00\x0c\x00\xc1\xc8\xde\x7f\xe7\xf4i\xe2#\xa4\xfb+TX \xc3\xcf\xcc\xec\xbd\xd7Z\x8fy\xfe\xf8\xba\xfa\xf5\xf8\x97\x1fyu\xe5X\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1@\xb1\xc0\r\xb2B\x03\xc2\tb\xf3b\x00\x00\x00\x00IEND\xaeB`\x82',
+    'viridis': b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01QIDATx\x9c\xed\xd01r\x84@\x0c\x05\xd1\x99/\n.\xe6+\xf8\xfe'a\xe4\xc0\xcb.Ebw\xde/\x98\x92\x04Q\xcf\xaf\xfa\xee\xca\xd8jT\xba\xf2z\xef\xebV\xe3sO\xd7c\xcd\xa8\x1a\x95\xde\xd2\x99]\xa33\xfez\xe7\xf3\xf2;\xdc\xe6\x91\xaeZIWV\xb2\xees\xaa+\xeb9W\xe75\xac\xca{\xee\xca\xda\xb2\xf6y\x1e\xf3zo\xeb>\xd7\x9eu\xcc\xf3\xba\xac#\xe7~}:\xe6\xda\xf3\xf9\xf3\x98g\x86\xfe\xcdX\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x80\x1f\xc7\x13W\xcd\xf0$\x17(\x00\x00\x00\x00IEND\xaeB`\x82",
+    'inferno': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01KIDATx\x9c\xed\xd0\xb1R\xc4@\x0c\x04Qi5\xeb\xfb\xff\xff\xc5e\x02C\xe1\x83\x84\xce\xfb\x05.yj\xa3\xeeU{z\xa7\x93\xcat\xa6v:\xe9Lez\xdfc\xbe\xf7\xa9\xa4\x1f\xfb\xfd\xe6g\xef\xf4\x95ue]_\x07\xfa}\xec3\xd7\xcc\xc7\xca9s\xfe\xfa\xae9\xe7\xbe\xef\xf1\xfd^\xf3|\xfc1svV\xed\xa3\xf2\xaa}t\x8e\xcaQ\xfb\xa8\xfd\xaa\xf7\xbb\xff\xee9j\xbf\xfaq\xaf\xd2\xbf\x19\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16\xf0\t\xa4\xfa4a\xe5&=\xc3\x00\x00\x00\x00IEND\xaeB`\x82',
+    'plasma': b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01QIDATx\x9c\xed\xd0\xb1N\xc60\x0c\x00a;v\xc5\xc8c\xf3\xd4\x8d\x19h\xa1?\x12\x12\xb7\xdf79N\xb2\\\xbe\xbf}t\xe4\x11\xd9\xb3\x8e\xc8\x8e<\xe2\x1ef]W\x8f\xcd\xfd\xe6eymV\xd4\xdaU\xbbj?\x86\xa9:\xab\xe6{\xd9\xbf\x1f|\r\xf3\xb2\xac\xbdj\xaf:\xf3\x1a\xeec\xff\x1c\xb3\xce\xc7\xd5\xce\xde\xeb\xb1\xc9\xba\x8e\xd9{z\xa2'z\xa6\xf7=L\xf4\x8e\x9e\xa9\x89c\xa6\x9e\xfb\x89?\xbe\xac\xd0\xbf\x19\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16\xf0\t\xd4\xd6Y\xcf\xac{\\!\x00\x00\x00\x00IEND\xaeB`\x82",
+    'magma': b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01UIDATx\x9c\xed\xd01n\x031\x0c\x05QR\xfc\xf4\xfdO\x9cM\xb1v\x10\x07.2\xfd<\x08\x0bJ\xcbj\xfa\xd4c:\xd3\x8ft\xa6vz\xa73\xf5\x98Nz\xa7wj\xa73\xbdy\xfe\xbd\x17vz_\x0by\xcd']9\x95\xae=\x95\xae\xf4u_?|\xbbrj\x9f\xd7\xeb\xf7c\xbafj\xe6k\xa6&\xd7\x99k\xee\xf33\xe7\x9ay\x9b\x9f\xd7Os\xe7\xd4\xa66\x95\xa9M%\xb5?\xc3\xebq\xdf\xe7{'\x7f\xdfO\xe9\xdf\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b\xf8\x06\xcc[\x1cz\xee\x07X\x9b\x00\x00\x00\x00IEND\xaeB`\x82",
+    'turbo': b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00d\x00\x00\x00d\x08\x02\x00\x00\x00\xff\x80\x02\x03\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01\x9aIDATx\x9c\xed\xd0\xb1q\x1c1\x10\x05Q\x0c\xb4\x0bPUw\x97\x82\x92P\x08\xca?\x1e\x01\xb7\xc0\xd0 O%zl\xbf\x9f\x81\xfa5\xf0:~\xff\xfaS\xdb\xbd\xf6G\xed\xb7\xda\xee\xb5\xdf\x7f\xb4[\xed\x8f\xda\xef\xb5\xddj\xbf\xd7\xfe\xa8\xed\x96-v\x8bl%[\xbcvd+\xaf\x11\xd9"\xcf\x15\xc7(\xe7\x8cc\xc61\xca1\xe3\x9c\xe5\xcb\x1eq\xcc\xb7\x98=>\xde\xe7\xcf\x18=\xe6[<?.\x9f_e\xb6\\}\x95\xf3\xca\xb6\xcay\x95\xb6\xb2]\xe5\\\xa5]\xd9ViW9W\xb6\xab\xc4\xdc13\xe6\xfe\x1cc\x7f\xb9\x8c,s\x97\xe7\xbe\xe6^s\xaf\x99\xd7s\xaf\xb9\xd7\x7f\x97\x7f{\xae\x1c+\xff\xae\x1c+\xe7\xca\xb1s\xac\x1c\xd7k\xac\x1c+k\xd1\xb7\x19\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16`,\xc0X\x80\xb1\x00c\x01\xc6\x02\x8c\x05\x18\x0b0\x16\xf0\x0e9\xc2\x9bn\xf4\xb6c\x0c\x00\x00\x00\x00IEND\xaeB`\x82',
+}
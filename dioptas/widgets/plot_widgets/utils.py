@@ -24,52 +24,464 @@ from typing import Optional
 import numbers
 import numpy as np
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+_AUTO_LEVEL_MAX_SAMPLES = 500_000
+"""Statistical autoscale modes subsample the data above this number of pixels.
+
+Set to None to always use all pixels.
+"""
+
+
+def _subsample(data: np.ndarray) -> np.ndarray:
+    """Returns a strided view of data with at most ~_AUTO_LEVEL_MAX_SAMPLES values
+
+    :param data: 1D array to subsample
+    :returns: Subsampled view or data
+    """
+    if _AUTO_LEVEL_MAX_SAMPLES is None or data.size <= _AUTO_LEVEL_MAX_SAMPLES:
+        return data
+    return data[:: data.size // _AUTO_LEVEL_MAX_SAMPLES]
+
 
 def _default_auto_level(data: np.ndarray) -> tuple[float, float]:
-    """Compute colormap range from data through histogram
+    """Compute colormap range from data with a 99.6% upper cutoff
+
+    The upper limit is the 99.6th percentile of the data, selected exactly
+    with :func:`numpy.percentile` and ``method='lower'`` (a single C-level
+    introselect pass). The lower limit is the smallest positive value if any,
+    else the minimum.
 
     :param data: Data from which to compute levels
     :returns: (lower limit, upper limit)
     """
-    counts, bin_edges = np.histogram(data, bins=3000)
+    data = _subsample(data.ravel())
+    min_level = float(np.min(data))
+    max_level = float(np.percentile(data, 99.6, method="lower"))
+
+    min_positive = np.min(np.where(data > 0, data, np.inf))
+    if np.isfinite(min_positive):
+        min_level = max(min_level, float(min_positive))
+    return min_level, max_level
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _fused_default_from_histogram(counts, left_edges):
+        """Fused single-loop version of _default_auto_level_from_histogram
+
+        :param counts: Histogram counts
+        :param left_edges: Left edge of each histogram bin
+        :returns: (lower limit, upper limit)
+        """
+        total = 0.0
+        for index in range(counts.size):
+            total += counts[index]
+        threshold = 0.996 * total
+
+        cumsum = 0.0
+        first = -1
+        second = -1
+        last = -1
+        max_index = -1
+        min_positive = np.inf
+        for index in range(counts.size):
+            count = counts[index]
+            if count <= 0:
+                continue
+            if first < 0:
+                first = index
+            elif second < 0:
+                second = index
+            last = index
+            cumsum += count
+            if cumsum < threshold:
+                max_index = index
+            edge = left_edges[index]
+            if 0 < edge < min_positive:
+                min_positive = edge
+
+        if second >= 0:
+            min_level = 0.5 * (left_edges[first] + left_edges[second])
+        else:
+            min_level = left_edges[first]
+        if max_index >= 0:
+            max_level = left_edges[max_index]
+        else:
+            max_level = 0.5 * left_edges[last]
+        if np.isfinite(min_positive):
+            min_level = max(min_level, min_positive)
+        return min_level, max_level
+
+    @numba.njit(cache=True)
+    def _fused_mean3std_from_histogram(counts, bin_edges):
+        """Fused single-loop version of _mean3std_auto_level_from_histogram
+
+        :param counts: Histogram counts
+        :param bin_edges: Histogram bin edges (``len(counts) + 1``)
+        :returns: (lower limit, upper limit)
+        """
+        sum_weights = 0.0
+        sum_wx = 0.0
+        sum_wx2 = 0.0
+        first = -1
+        last = -1
+        for index in range(counts.size):
+            count = counts[index]
+            if count <= 0:
+                continue
+            center = 0.5 * (bin_edges[index] + bin_edges[index + 1])
+            sum_weights += count
+            sum_wx += count * center
+            sum_wx2 += count * center * center
+            if first < 0:
+                first = index
+            last = index
+
+        mean = sum_wx / sum_weights
+        variance = max(sum_wx2 / sum_weights - mean * mean, 0.0)
+        std = np.sqrt(variance)
+        minimum = bin_edges[first]
+        maximum = bin_edges[last + 1]
+        return max(mean - 3 * std, minimum), min(mean + 3 * std, maximum)
+
+    # Trigger JIT compilation at import time rather than on first redraw:
+    # compiled code is reloaded from numba's on-disk cache on later runs
+    _fused_default_from_histogram(np.ones(2, dtype=np.int64), np.zeros(2))
+    _fused_mean3std_from_histogram(np.ones(2, dtype=np.int64), np.zeros(3))
+
+else:
+    _fused_default_from_histogram = None
+    _fused_mean3std_from_histogram = None
+
+
+def _default_auto_level_from_histogram(
+    counts: np.ndarray, bin_edges: np.ndarray
+) -> tuple[float, float]:
+    """Compute colormap range from a precomputed histogram
+
+    :param counts: Histogram counts
+    :param bin_edges: Histogram bin edges (``len(counts) + 1``)
+    :returns: (lower limit, upper limit)
+    """
+    if _fused_default_from_histogram is not None:
+        min_level, max_level = _fused_default_from_histogram(counts, bin_edges[:-1])
+        return float(min_level), float(max_level)
+
     left_edges = bin_edges[:-1]
     left_edges = left_edges[np.where(counts > 0)]
     counts = counts[np.where(counts > 0)]
 
     hist_y_cumsum = np.cumsum(counts)
-    hist_y_sum = np.sum(counts)
+    threshold = 0.996 * hist_y_cumsum[-1]
 
-    max_ind = np.where(hist_y_cumsum < (0.996 * hist_y_sum))
     min_level = np.mean(left_edges[:2])
 
-    if len(max_ind[0]):
-        max_level = left_edges[max_ind[0][-1]]
+    # Last index with cumulated counts below the threshold: binary search
+    # instead of masking the whole cumulated sum
+    max_index = np.searchsorted(hist_y_cumsum, threshold, side="left") - 1
+    if max_index >= 0:
+        max_level = left_edges[max_index]
     else:
         max_level = 0.5 * np.max(left_edges)
 
-    if len(left_edges[left_edges > 0]) > 0:
-        min_level = max(min_level, np.nanmin(left_edges[left_edges > 0]))
+    # left_edges is sorted: the smallest positive edge is right after 0
+    index = np.searchsorted(left_edges, 0.0, side="right")
+    if index < len(left_edges):
+        min_level = max(min_level, float(left_edges[index]))
     return min_level, max_level
 
 
+def weighted_average_std(a: np.ndarray, weights: np.ndarray) -> tuple[float, float]:
+    """Returns average and standard deviation of values weighted by weights
+
+    Computed in a single pass with BLAS dot products using the identity
+    Var[X] = E[X²] - E[X]².
+
+    :param a: Values to average
+    :param weights: Weight of each value
+    :returns: (average, standard deviation)
+    """
+    # Explicit accumulator dtype: float32 inputs are reduced as float32
+    # (half the memory traffic), anything else accumulates as float64
+    dtype = np.result_type(a.dtype, weights.dtype)
+    if not np.issubdtype(dtype, np.floating):
+        dtype = np.float64
+    sum_weights = np.sum(weights, dtype=dtype)
+    average = np.dot(a, weights) / sum_weights
+    variance = np.dot(weights, np.square(a)) / sum_weights - average**2
+    # Guard against catastrophic cancellation for (near-)constant values
+    return float(average), float(np.sqrt(max(variance, 0.0)))
+
+
+def _minmax_auto_level_from_histogram(
+    counts: np.ndarray, bin_edges: np.ndarray
+) -> tuple[float, float]:
+    """Returns edges of the first and last non-empty bins of a histogram
+
+    :param counts: Histogram counts
+    :param bin_edges: Histogram bin edges (``len(counts) + 1``)
+    :returns: (min, max)
+    """
+    nonzero_indices = np.flatnonzero(counts)
+    return float(bin_edges[nonzero_indices[0]]), float(bin_edges[nonzero_indices[-1] + 1])
+
+
+def _mean3std_auto_level_from_histogram(
+    counts: np.ndarray, bin_edges: np.ndarray
+) -> tuple[float, float]:
+    """Returns mean+/-3std estimated from bin centers weighted by counts
+
+    :param counts: Histogram counts
+    :param bin_edges: Histogram bin edges (``len(counts) + 1``)
+    :returns: (lower limit, upper limit)
+    """
+    if _fused_mean3std_from_histogram is not None:
+        lower, upper = _fused_mean3std_from_histogram(counts, bin_edges)
+        return float(lower), float(upper)
+
+    bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
+    mean, std = weighted_average_std(bin_centers, counts)
+    minimum, maximum = _minmax_auto_level_from_histogram(counts, bin_edges)
+    return max(mean - 3 * std, minimum), min(mean + 3 * std, maximum)
+
+
+_HISTOGRAM_MODES = {
+    "default": _default_auto_level_from_histogram,
+    "minmax": _minmax_auto_level_from_histogram,
+    "mean3std": _mean3std_auto_level_from_histogram,
+}
+
+
+_AUTOLEVEL_CACHE: dict[tuple, tuple[float, float]] = {}
+"""Memoized :func:`auto_level_from_histogram` results, evicted FIFO"""
+
+_AUTOLEVEL_CACHE_MAX_ENTRIES = 8
+
+
+def auto_level_cache_clear():
+    """Clears memoized auto-level results (e.g., on widget teardown)"""
+    _AUTOLEVEL_CACHE.clear()
+
+
+def auto_level_from_histogram(
+    counts: np.ndarray, bin_edges: np.ndarray, mode: str = "default"
+) -> Optional[tuple[float, float]]:
+    """Returns colormap range from a precomputed histogram
+
+    Fast path avoiding a re-scan of the raw data when a histogram is available.
+    Results are memoized on a cheap fingerprint of the histogram since
+    interactive redraws often recompute levels for an unchanged histogram.
+
+    :param counts: Histogram counts
+    :param bin_edges: Histogram bin edges (``len(counts) + 1``)
+    :param mode: Autoscale mode in 'default', 'minmax', 'mean3std'
+    :returns: (lower limit, upper limit) or None
+    """
+    total = np.sum(counts)
+    if len(counts) == 0 or total == 0:
+        return None
+    func = _HISTOGRAM_MODES.get(mode, None)
+    if func is None:
+        raise ValueError(f"Unsupported mode: {mode}")
+
+    # Include content samples: buffer address, size and total counts alone
+    # can collide when a freed histogram buffer is reallocated at the same
+    # address for the next frame
+    key = (
+        mode,
+        counts.ctypes.data,
+        counts.nbytes,
+        bin_edges.ctypes.data,
+        int(total),
+        float(counts[0]),
+        float(counts[-1]),
+        float(counts[len(counts) // 2]),
+        float(bin_edges[0]),
+        float(bin_edges[-1]),
+    )
+    if key in _AUTOLEVEL_CACHE:
+        return _AUTOLEVEL_CACHE[key]
+
+    range_ = func(counts, bin_edges)
+    if len(_AUTOLEVEL_CACHE) >= _AUTOLEVEL_CACHE_MAX_ENTRIES:
+        _AUTOLEVEL_CACHE.pop(next(iter(_AUTOLEVEL_CACHE)))
+    _AUTOLEVEL_CACHE[key] = range_
+    return range_
+
+
+def auto_level_all_from_histogram(
+    counts: np.ndarray, bin_edges: np.ndarray
+) -> Optional[dict[str, tuple[float, float]]]:
+    """Returns colormap ranges of all autoscale modes from a histogram
+
+    Convenience for callers comparing autoscale strategies: each mode is
+    computed by its fused kernel and memoized, so toggling between modes
+    on an unchanged histogram does not rescan it.
+
+    :param counts: Histogram counts
+    :param bin_edges: Histogram bin edges (``len(counts) + 1``)
+    :returns: Mapping of mode to (lower limit, upper limit) or None
+    """
+    if len(counts) == 0 or np.sum(counts) == 0:
+        return None
+    return {
+        mode: auto_level_from_histogram(counts, bin_edges, mode)
+        for mode in _HISTOGRAM_MODES
+    }
+
+
+def _filter_finite(data: np.ndarray) -> np.ndarray:
+    """Returns the finite values of data, avoiding a copy when possible
+
+    Integer arrays and float arrays without NaN/Inf are returned as-is.
+
+    :param data: Array to filter
+    :returns: Array of finite values
+    """
+    if np.issubdtype(data.dtype, np.integer):
+        return data  # Cannot contain non-finite values
+    if not np.isnan(data).any() and not np.isinf(data).any():
+        return data
+    return data[np.isfinite(data)]
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _fused_minmax(data):
+        """Single-pass min/max of a non-empty 1D array
+
+        :param data: 1D array from which to compute min/max
+        :returns: (min, max)
+        """
+        minimum = data[0]
+        maximum = data[0]
+        for index in numba.prange(data.size):
+            value = data[index]
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+        return minimum, maximum
+
+    # Trigger JIT compilation at import time rather than on first redraw:
+    # compiled code is reloaded from numba's on-disk cache on later runs
+    _fused_minmax(np.zeros(2))
+
+else:
+    _fused_minmax = None
+
+
 def _minmax_auto_level(data: np.ndarray) -> tuple[float, float]:
     """Returns min/max of the data
 
     :param data: Data from which to compute levels
     :returns: (min, max)
     """
+    if _fused_minmax is not None:
+        minimum, maximum = _fused_minmax(np.ravel(data))
+        return float(minimum), float(maximum)
     return float(np.min(data)), float(np.max(data))
 
 
-def _mean3std_auto_level(data: np.ndarray) -> tuple[float, float]:
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _fused_stats(data, nchunks):
+        """Single-pass count/mean/std/min/max of finite values of a 1D array
+
+        Uses Welford's online algorithm per thread, combined with Chan's
+        parallel variance formula.
+
+        :param data: 1D array of float from which to compute statistics
+        :param nchunks: Number of chunks to process in parallel
+            (numba.get_num_threads() is a dynamic global that would
+            prevent caching the compiled function)
+        :returns: (count, mean, std, min, max) of finite values
+        """
+        chunk_size = (data.size + nchunks - 1) // nchunks
+        counts = np.zeros(nchunks, dtype=np.int64)
+        means = np.zeros(nchunks, dtype=np.float64)
+        m2s = np.zeros(nchunks, dtype=np.float64)
+        minima = np.full(nchunks, np.inf)
+        maxima = np.full(nchunks, -np.inf)
+
+        for chunk in numba.prange(nchunks):
+            start = chunk * chunk_size
+            stop = min(start + chunk_size, data.size)
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            minimum = np.inf
+            maximum = -np.inf
+            for index in range(start, stop):
+                value = data[index]
+                if np.isfinite(value):
+                    count += 1
+                    delta = value - mean
+                    mean += delta / count
+                    m2 += delta * (value - mean)
+                    minimum = min(minimum, value)
+                    maximum = max(maximum, value)
+            counts[chunk] = count
+            means[chunk] = mean
+            m2s[chunk] = m2
+            minima[chunk] = minimum
+            maxima[chunk] = maximum
+
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for chunk in range(nchunks):
+            if counts[chunk] == 0:
+                continue
+            total = count + counts[chunk]
+            delta = means[chunk] - mean
+            m2 += m2s[chunk] + delta * delta * count * counts[chunk] / total
+            mean = (count * mean + counts[chunk] * means[chunk]) / total
+            count = total
+
+        if count == 0:
+            return 0, 0.0, 0.0, np.inf, -np.inf
+        return count, mean, np.sqrt(m2 / count), np.min(minima), np.max(maxima)
+
+    # Trigger JIT compilation at import time rather than on first redraw:
+    # compiled code is reloaded from numba's on-disk cache on later runs
+    _fused_stats(np.zeros(2), numba.get_num_threads())
+
+else:
+    _fused_stats = None
+
+
+def _mean3std_auto_level(data: np.ndarray) -> Optional[tuple[float, float]]:
     """Returns mean+/-3std clipped to min/max of the data
 
+    Non-finite values are ignored.
+
     :param data: Data from which to compute levels
-    :returns: (lower limit, upper limit)
+    :returns: (lower limit, upper limit) or None if there is no finite value
     """
-    mean = np.mean(data, dtype=np.float64)
-    std = np.std(data, dtype=np.float64)
-    minimum, maximum = _minmax_auto_level(data)
+    data = _subsample(np.ravel(data))
+    if _fused_stats is not None:
+        if not np.issubdtype(data.dtype, np.floating):
+            data = data.astype(np.float64)
+        # float32 data is read as float32 (accumulators are float64)
+        count, mean, std, minimum, maximum = _fused_stats(
+            data, numba.get_num_threads()
+        )
+        if count == 0:
+            return None
+    else:
+        data = data[np.isfinite(data)]
+        if data.size == 0:
+            return None
+        mean = np.mean(data, dtype=np.float64)
+        std = np.std(data, dtype=np.float64)
+        minimum, maximum = _minmax_auto_level(data)
     return max(mean - 3 * std, minimum), min(mean + 3 * std, maximum)
 
 
@@ -145,7 +557,6 @@ class AutoLevel:
     _MODES = {
         "default": _default_auto_level,
         "minmax": _minmax_auto_level,
-        "mean3std": _mean3std_auto_level,
     }
     _PERCENTILE_REGEXP = re.compile(r"(?P<value>\d+(\.\d*)?|\.\d+)percentile")
 
@@ -168,7 +579,12 @@ class AutoLevel:
         if self.filter_dummy:
             data = data[detector_gap_mask(data)]
 
-        filtered_data = data[np.isfinite(data)]
+        if self.mode == "mean3std":
+            # Non-finite values are filtered during the computation:
+            # no need to allocate a filtered copy of the data
+            return _mean3std_auto_level(data)
+
+        filtered_data = _filter_finite(data)
         if filtered_data.size == 0:
             return None
 
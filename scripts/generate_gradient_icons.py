@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Generate dioptas/widgets/plot_widgets/_gradient_icons.py
+
+Pre-renders the built-in pyqtgraph gradients used by the ColormapPopup
+widget to PNG bytes so that no QPainter rasterization is needed at
+runtime. Re-run this script whenever pyqtgraph's built-in gradients
+change.
+"""
+
+import os
+
+from qtpy import QtCore, QtGui, QtWidgets
+import pyqtgraph.graphicsItems.GradientEditorItem
+
+TARGET = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "dioptas",
+    "widgets",
+    "plot_widgets",
+    "_gradient_icons.py",
+)
+
+HEADER = '''# -*- coding: utf-8 -*-
+"""Pre-rendered PNG icons of the built-in pyqtgraph gradients
+
+Generated by scripts/generate_gradient_icons.py: do not edit manually.
+"""
+from __future__ import annotations
+
+ICONS: dict[str, bytes] = {
+'''
+
+
+def render_gradient_png(gradient: dict) -> bytes:
+    """Renders a pyqtgraph gradient to a 100x100 PNG"""
+    gradientEditorItem = pyqtgraph.graphicsItems.GradientEditorItem.GradientEditorItem()
+    gradientEditorItem.setLength(100)
+    gradientEditorItem.restoreState(gradient)
+    qgradient = gradientEditorItem.getGradient()
+
+    pixmap = QtGui.QPixmap(100, 100)
+    painter = QtGui.QPainter(pixmap)
+    painter.fillRect(QtCore.QRect(0, 0, 100, 100), QtGui.QBrush(qgradient))
+    painter.end()
+
+    buffer = QtCore.QBuffer()
+    buffer.open(QtCore.QIODevice.WriteOnly)
+    pixmap.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+
+def main():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    with open(TARGET, "w") as file:
+        file.write(HEADER)
+        for name, gradient in pyqtgraph.graphicsItems.GradientEditorItem.Gradients.items():
+            file.write(f"    {name!r}: {render_gradient_png(gradient)!r},\n")
+        file.write("}\n")
+    print(f"Written {TARGET}")
+
+
+if __name__ == "__main__":
+    main()